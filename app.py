@@ -1,25 +1,358 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, g, has_request_context, make_response, render_template, request, jsonify, stream_with_context
+from contextlib import contextmanager
+from functools import wraps
+import gzip
+import hashlib
+import json
 import random
+import re
 from datetime import datetime, timedelta
 import sqlite3
 import os
+import shutil
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 from flask_cors import CORS
+import numpy as np
 
 app = Flask(__name__)
 CORS(app)
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'app.db')
+# Closed bugs older than BUG_ARCHIVE_AFTER_DAYS are moved here so the hot bugs table stays small
+ARCHIVE_DB_PATH = os.environ.get('ARCHIVE_DB_PATH', os.path.join(os.path.dirname(__file__), 'app_archive.db'))
+BUG_ARCHIVE_AFTER_DAYS = int(os.environ.get('BUG_ARCHIVE_AFTER_DAYS', 30))
+BUG_ARCHIVE_INTERVAL_SECONDS = int(os.environ.get('BUG_ARCHIVE_INTERVAL_SECONDS', 3600))
+MAINTENANCE_BATCH_SIZE = 500
+# Change-feed events older than this are compacted; clients with older cursors must resync
+BUG_EVENTS_RETENTION_HOURS = int(os.environ.get('BUG_EVENTS_RETENTION_HOURS', 24))
+
+BUG_COLUMNS = "id, title, severity, status, component, assignee, reporter, created_at, closed_at"
+
+# Read replica for heavy read-only endpoints: 'file', 'memory' or 'off'. 'memory' keeps
+# a full copy of app.db and the archive in RAM, so it only suits small databases.
+READ_REPLICA = os.environ.get('READ_REPLICA', 'file')
+REPLICA_PATH = os.environ.get('REPLICA_PATH', os.path.join(os.path.dirname(__file__), 'app_replica.db'))
+# A snapshot older than this is refreshed before it is handed out
+REPLICA_MAX_STALENESS = float(os.environ.get('REPLICA_MAX_STALENESS', 60))
+# Background refresh interval, for snapshots read since they were taken; 0 refreshes only
+# when the staleness budget runs out
+REPLICA_REFRESH_SECONDS = float(os.environ.get('REPLICA_REFRESH_SECONDS', 30))
+# Copies to attempt when another process keeps archiving while the snapshot is taken
+REPLICA_SNAPSHOT_ATTEMPTS = 3
+
+_replica = {
+    'uri': None, 'main_anchor': None,
+    'archive_uri': None, 'archive_anchor': None, 'archive_version': None,
+    'taken_at': 0.0, 'read_at': 0.0, 'generation': 0,
+}
+# Guards _replica: swaps, and opening connections on the current snapshot
+_replica_lock = threading.Lock()
+# Held while a new snapshot is being copied, so only one refresh runs at a time
+_replica_refresh_lock = threading.Lock()
 
 
 def get_db_connection():
+    # Endpoints decorated with @reads_from_replica transparently read the snapshot
+    if READ_REPLICA != 'off' and has_request_context() and g.get('use_replica'):
+        return get_replica_connection()
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def _snapshot(source_path, name, generation):
+    """Back up `source_path` (or an empty archive schema if it is missing) into a new snapshot.
+
+    Returns (uri, anchor, staged): the URI readers open; for memory snapshots the
+    connection that keeps the shared in-memory database alive; for file snapshots
+    the (temp, final) paths to move into place when the snapshot is swapped in.
+    """
+    if READ_REPLICA == 'memory':
+        uri = f"file:{name}_{generation}?mode=memory&cache=shared"
+        target = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    else:
+        base, ext = os.path.splitext(REPLICA_PATH)
+        path = REPLICA_PATH if name == 'app_replica' else f"{base}_archive{ext}"
+        uri = f"file:{path}?mode=ro"
+        target = sqlite3.connect(f"{path}.tmp")
+    if os.path.exists(source_path):
+        source = sqlite3.connect(source_path)
+        source.backup(target)
+        source.close()
+    else:
+        _create_archive_schema(target, 'main')
+        target.commit()
+    if READ_REPLICA == 'memory':
+        return uri, target, None
+    # The copied header may say WAL; a read-only snapshot is simpler as a plain file
+    target.execute("PRAGMA journal_mode=DELETE")
+    target.close()
+    return uri, None, (f"{path}.tmp", path)
+
+
+def _discard_snapshot(anchor, staged):
+    if anchor is not None:
+        anchor.close()
+    if staged:
+        os.remove(staged[0])
+
+
+def archive_version():
+    """Counter bumped by every change to the archive's rows (see bump_archive_version)."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("SELECT value FROM app_meta WHERE key = 'archive_version'").fetchone()
+    conn.close()
+    return row[0] if row else None
+
+
+def bump_archive_version(conn):
+    """Call inside any transaction that changes archive.bugs, so replicas notice."""
+    conn.execute(
+        """
+        INSERT INTO app_meta (key, value) VALUES ('archive_version', 1)
+        ON CONFLICT(key) DO UPDATE SET value = value + 1
+        """
+    )
+
+
+def refresh_replica(max_age=None, wait=True):
+    """Snapshot app.db and the bug archive with the sqlite3 backup API and swap them in.
+
+    In WAL mode the copy is an ordinary reader, so writers are never blocked.
+    The archive is only copied again when archive_version() has moved, since
+    it is large and rarely changes. Copies are taken under the archive lock,
+    which archiving holds one batch at a time. Another process sharing app.db
+    can still archive between the two copies, so the version is read again
+    afterwards and the copy redone if it moved: a batch being moved is never
+    seen twice or not at all. Connections already open on the previous
+    snapshot keep reading it until they close. With `max_age`, a snapshot
+    younger than that is kept as is; with `wait=False`, return at once if
+    another refresh is already running.
+    """
+    if not _replica_refresh_lock.acquire(blocking=wait):
+        return
+    try:
+        if max_age is not None and time.time() - _replica['taken_at'] <= max_age:
+            return
+        generation = _replica['generation'] + 1
+        with _archive_lock:
+            for attempt in range(REPLICA_SNAPSHOT_ATTEMPTS):
+                version = archive_version()
+                uri, main_anchor, main_staged = _snapshot(DB_PATH, 'app_replica', generation)
+                reuse_archive = _replica['archive_uri'] is not None and version == _replica['archive_version']
+                if reuse_archive:
+                    archive_uri, archive_anchor, archive_staged = _replica['archive_uri'], _replica['archive_anchor'], None
+                else:
+                    archive_uri, archive_anchor, archive_staged = _snapshot(
+                        ARCHIVE_DB_PATH, 'app_replica_archive', generation
+                    )
+                if archive_version() == version:
+                    break
+                _discard_snapshot(main_anchor, main_staged)
+                if not reuse_archive:
+                    _discard_snapshot(archive_anchor, archive_staged)
+            else:
+                app.logger.warning("Archive kept changing; read replica left at its previous snapshot")
+                return
+        with _replica_lock:
+            # Both files change together, and never while a reader is opening them
+            for staged in (main_staged, archive_staged):
+                if staged:
+                    os.replace(*staged)
+            previous = [_replica['main_anchor']]
+            if not reuse_archive:
+                previous.append(_replica['archive_anchor'])
+            _replica.update(
+                uri=uri,
+                main_anchor=main_anchor,
+                archive_uri=archive_uri,
+                archive_anchor=archive_anchor,
+                archive_version=version,
+                taken_at=time.time(),
+                generation=generation,
+            )
+            # Readers connect under this lock, so none can still be about to open these
+            for anchor in previous:
+                if anchor is not None:
+                    anchor.close()
+    finally:
+        _replica_refresh_lock.release()
+
+
+def get_replica_connection():
+    if time.time() - _replica['taken_at'] > REPLICA_MAX_STALENESS:
+        # One request refreshes; while it copies, the others keep reading the previous
+        # snapshot rather than queueing behind it (they wait only if there is none yet)
+        refresh_replica(max_age=REPLICA_MAX_STALENESS, wait=_replica['uri'] is None)
+    with _replica_lock:
+        conn = sqlite3.connect(_replica['uri'], uri=True)
+        # Pre-attached, so select_bugs() reads the archive as of the same instant
+        conn.execute("ATTACH DATABASE ? AS archive", (_replica['archive_uri'],))
+        taken_at = _replica['taken_at']
+        _replica['read_at'] = time.time()
+    conn.row_factory = sqlite3.Row
+    if has_request_context():
+        g.snapshot_taken_at = taken_at
+    return conn
+
+
+def reads_from_replica(fn):
+    """Route a read-only endpoint's get_db_connection() calls to the snapshot and report its age."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if READ_REPLICA == 'off':
+            return fn(*args, **kwargs)
+        g.use_replica = True
+        resp = make_response(fn(*args, **kwargs))
+        taken_at = g.get('snapshot_taken_at')
+        if taken_at:
+            resp.headers['X-Snapshot-Age'] = f"{time.time() - taken_at:.1f}"
+            resp.headers['X-Snapshot-Taken-At'] = datetime.utcfromtimestamp(taken_at).isoformat() + 'Z'
+        return resp
+    return wrapper
+
+
+def _replica_loop():
+    while True:
+        try:
+            # Only a snapshot that has been read since it was taken is worth copying again;
+            # an idle app copies nothing, and the first reader takes the initial snapshot
+            if _replica['uri'] is not None and _replica['read_at'] >= _replica['taken_at']:
+                refresh_replica()
+        except sqlite3.Error as e:
+            app.logger.warning("Refreshing read replica failed: %s", e)
+        time.sleep(REPLICA_REFRESH_SECONDS)
+
+
+def start_replica_refresher():
+    if READ_REPLICA != 'off' and REPLICA_REFRESH_SECONDS > 0:
+        threading.Thread(target=_replica_loop, name='replica-refresher', daemon=True).start()
+
+
+def _archive_high_water(conn):
+    """Newest created_at of any archived bug, or None if nothing has been archived."""
+    row = conn.execute("SELECT value FROM app_meta WHERE key = 'archive_created_through'").fetchone()
+    return row[0] if row else None
+
+
+def _create_archive_schema(conn, schema):
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.bugs (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            status TEXT NOT NULL,
+            component TEXT NOT NULL,
+            assignee TEXT,
+            reporter TEXT,
+            created_at TEXT NOT NULL,
+            closed_at TEXT
+        )
+        """
+    )
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {schema}.idx_archive_bugs_created ON bugs(created_at)")
+
+
+def attach_archive(conn):
+    """ATTACH the bug archive to `conn` as `archive`, creating it on first use."""
+    attached = any(r[1] == 'archive' for r in conn.execute("PRAGMA database_list"))
+    if not attached:
+        conn.execute("ATTACH DATABASE ? AS archive", (ARCHIVE_DB_PATH,))
+        _create_archive_schema(conn, 'archive')
+    return conn
+
+
+def select_bugs(conn, columns=BUG_COLUMNS, where=None, params=(), since=None, status=None, tail="",
+                hot_only=False, aggregate=None, lazy=False):
+    """Select bugs from the hot table, unioning the archive only when the query can reach it.
+
+    Archived bugs are all closed and none was created after the archive's
+    high-water mark, so a query restricted to another status, or to bugs
+    created after that mark, never needs to touch the archive file. With
+    `aggregate`, each table's rows are wrapped in SELECT <aggregate> FROM (...)
+    separately, and one aggregate row per table is returned; that avoids
+    materialising the union. With `lazy`, the cursor is returned unfetched so
+    the caller can stream it.
+    """
+    clauses = list(where or [])
+    values = list(params)
+    if status is not None:
+        clauses.append("status = ?")
+        values.append(status)
+    if since is not None:
+        clauses.append("created_at >= ?")
+        values.append(since)
+    where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    high_water = None if hot_only else _archive_high_water(conn)
+    needs_archive = (
+        high_water is not None
+        and (status is None or status == 'closed')
+        and (since is None or since <= high_water)
+        and os.path.exists(ARCHIVE_DB_PATH)
+    )
+    if aggregate:
+        if needs_archive:
+            attach_archive(conn)
+        return [
+            conn.execute(f"SELECT {aggregate} FROM (SELECT {columns} FROM {table} {where_sql}) {tail}", values).fetchone()
+            for table in (['main.bugs', 'archive.bugs'] if needs_archive else ['main.bugs'])
+        ]
+    if not needs_archive:
+        cur = conn.execute(f"SELECT {columns} FROM main.bugs {where_sql} {tail}", values)
+        return cur if lazy else cur.fetchall()
+    attach_archive(conn)
+    cur = conn.execute(
+        f"""
+        SELECT * FROM (
+            SELECT {columns} FROM main.bugs {where_sql}
+            UNION ALL
+            SELECT {columns} FROM archive.bugs {where_sql}
+        ) {tail}
+        """,
+        values + values,
+    )
+    return cur if lazy else cur.fetchall()
+
+
+def record_bug_event(cur, bug_id, op):
+    """Append a change-feed event; call inside the transaction that changes the bug."""
+    cur.execute(
+        "INSERT INTO bug_events (bug_id, op, changed_at) VALUES (?,?,?)",
+        (bug_id, op, datetime.utcnow().isoformat() + 'Z'),
+    )
+
+
+def record_status_change(cur, bug_id, from_status, to_status, changed_at=None):
+    """Record a bug status transition; call inside the transaction that changes the bug."""
+    cur.execute(
+        "INSERT INTO bug_status_history (bug_id, from_status, to_status, changed_at) VALUES (?,?,?,?)",
+        (bug_id, from_status, to_status, changed_at or datetime.utcnow().isoformat() + 'Z'),
+    )
+
+
+def bug_report_dict(r):
+    return {
+        'id': r['id'],
+        'title': r['title'],
+        'severity': r['severity'],
+        'status': r['status'],
+        'component': r['component'],
+        'assignee': r['assignee'],
+        'reporter': r['reporter'],
+        'createdAt': r['created_at']
+    }
+
+
 def init_db():
     conn = get_db_connection()
     cur = conn.cursor()
+    # WAL keeps batched bulk writes (e.g. JUnit ingestion) cheap and lets readers run alongside them
+    cur.execute("PRAGMA journal_mode=WAL")
     # Users table
     cur.execute(
         """
@@ -52,10 +385,78 @@ def init_db():
             component TEXT NOT NULL,
             assignee TEXT,
             reporter TEXT,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL,
+            closed_at TEXT
+        )
+        """
+    )
+    # Migration: closed_at drives archiving of old closed bugs
+    bug_columns = [r[1] for r in cur.execute("PRAGMA table_info(bugs)")]
+    if 'closed_at' not in bug_columns:
+        cur.execute("ALTER TABLE bugs ADD COLUMN closed_at TEXT")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_bugs_status_closed ON bugs(status, closed_at)")
+
+    # Append-only change log for delta sync of bugs; seq never goes backwards
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bug_events (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            bug_id INTEGER NOT NULL,
+            op TEXT NOT NULL CHECK(op IN ('insert','update','delete')),
+            changed_at TEXT NOT NULL
+        )
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_bug_events_changed ON bug_events(changed_at)")
+    # Status transitions, so lifecycle analytics can see history instead of only the current state
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bug_status_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bug_id INTEGER NOT NULL,
+            from_status TEXT,
+            to_status TEXT NOT NULL,
+            changed_at TEXT NOT NULL
         )
         """
     )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_bug_status_history_bug ON bug_status_history(bug_id)")
+
+    # Background jobs: persisted so queued and interrupted work survives restarts
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL,
+            params TEXT NOT NULL DEFAULT '{}',
+            priority INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL CHECK(status IN ('queued','running','succeeded','failed','cancelled')),
+            progress INTEGER NOT NULL DEFAULT 0,
+            message TEXT,
+            result TEXT,
+            error TEXT,
+            checkpoint TEXT,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker_pid INTEGER,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT
+        )
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs(status, priority DESC, id)")
+
+    # Small key/value store for bookkeeping such as change-log compaction watermarks
+    cur.execute("CREATE TABLE IF NOT EXISTS app_meta (key TEXT PRIMARY KEY, value TEXT)")
+    # Archives written before the high-water mark was tracked
+    if os.path.exists(ARCHIVE_DB_PATH) and not cur.execute(
+        "SELECT 1 FROM app_meta WHERE key = 'archive_created_through'"
+    ).fetchone():
+        attach_archive(conn)
+        newest = cur.execute("SELECT MAX(created_at) FROM archive.bugs").fetchone()[0]
+        if newest:
+            cur.execute("INSERT INTO app_meta (key, value) VALUES ('archive_created_through', ?)", (newest,))
 
     # System health metrics table
     cur.execute(
@@ -128,6 +529,40 @@ def init_db():
         )
         """
     )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_test_cases_status ON test_cases(status)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_test_cases_component ON test_cases(component)")
+
+    # JUnit ingestion history: one row per ingested report, one result row per test case
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS test_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT,
+            total INTEGER DEFAULT 0,
+            passed INTEGER DEFAULT 0,
+            failed INTEGER DEFAULT 0,
+            skipped INTEGER DEFAULT 0,
+            duration REAL DEFAULT 0,
+            status TEXT NOT NULL
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS test_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL REFERENCES test_runs(id) ON DELETE CASCADE,
+            case_key TEXT NOT NULL,
+            status TEXT NOT NULL,
+            duration REAL,
+            message TEXT
+        )
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results(run_id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_test_results_case ON test_results(case_key)")
 
     # Seed users if empty
     cur.execute("SELECT COUNT(*) as c FROM users")
@@ -181,6 +616,18 @@ def init_db():
             seed_bugs,
         )
 
+    # Backfill status history for bugs that predate it: creation, plus closing where known
+    cur.execute("SELECT COUNT(*) FROM bug_status_history")
+    if cur.fetchone()[0] == 0:
+        cur.execute(
+            "INSERT INTO bug_status_history (bug_id, from_status, to_status, changed_at) "
+            "SELECT id, NULL, 'open', created_at FROM bugs"
+        )
+        cur.execute(
+            "INSERT INTO bug_status_history (bug_id, from_status, to_status, changed_at) "
+            "SELECT id, 'open', 'closed', closed_at FROM bugs WHERE status = 'closed' AND closed_at IS NOT NULL"
+        )
+
     # Seed 10 sample code files if empty
     cur.execute("SELECT COUNT(*) FROM code_files")
     if cur.fetchone()[0] == 0:
@@ -414,9 +861,296 @@ def init_db():
 
 init_db()
 
+# ---------------- Admission control -----------------
+
+# GET requests hold a read slot for their whole lifetime. SQLite allows one writer at a
+# time, so handlers take a write slot only around their actual write (see admission_slot),
+# and long report uploads get their own pool instead of either.
+ADMISSION_LIMITS = {
+    'read': int(os.environ.get('ADMISSION_READ_LIMIT', 16)),
+    'write': int(os.environ.get('ADMISSION_WRITE_LIMIT', 1)),
+    'ingest': int(os.environ.get('ADMISSION_INGEST_LIMIT', 1)),
+}
+# Longest a request may wait for a slot before it is rejected with 503
+ADMISSION_DEADLINES = {
+    'read': float(os.environ.get('ADMISSION_READ_DEADLINE', 2.0)),
+    'write': float(os.environ.get('ADMISSION_WRITE_DEADLINE', 1.0)),
+    'ingest': float(os.environ.get('ADMISSION_INGEST_DEADLINE', 1.0)),
+}
+# Per-client token bucket: sustained requests/second and burst size
+CLIENT_RATE = float(os.environ.get('ADMISSION_CLIENT_RATE', 20))
+CLIENT_BURST = float(os.environ.get('ADMISSION_CLIENT_BURST', 40))
+MAX_TRACKED_CLIENTS = 10000
+
+_admission_slots = {kind: threading.BoundedSemaphore(n) for kind, n in ADMISSION_LIMITS.items()}
+_admission_lock = threading.Lock()
+_admission_stats = {
+    kind: {'admitted': 0, 'shed': 0, 'inFlight': 0} for kind in ADMISSION_LIMITS
+}
+_admission_stats['rateLimited'] = 0
+_admission_stats['dbLocked'] = 0
+_client_buckets = {}
+
+
+def _take_client_token(client):
+    """Spend one token from `client`'s bucket; return 0, or seconds until a token is available."""
+    now = time.monotonic()
+    with _admission_lock:
+        if len(_client_buckets) > MAX_TRACKED_CLIENTS:
+            # Idle long enough to have refilled completely: dropping them changes nothing
+            idle = CLIENT_BURST / CLIENT_RATE
+            for key in [k for k, (_, last) in _client_buckets.items() if now - last > idle]:
+                del _client_buckets[key]
+        tokens, last = _client_buckets.get(client, (CLIENT_BURST, now))
+        tokens = min(CLIENT_BURST, tokens + (now - last) * CLIENT_RATE)
+        if tokens < 1:
+            _client_buckets[client] = (tokens, now)
+            return (1 - tokens) / CLIENT_RATE
+        _client_buckets[client] = (tokens - 1, now)
+        return 0
+
+
+def _shed(status, retry_after, message):
+    resp = jsonify({'error': message})
+    resp.status_code = status
+    resp.headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+    return resp
+
+
+def _acquire_slot(kind):
+    if not _admission_slots[kind].acquire(timeout=ADMISSION_DEADLINES[kind]):
+        with _admission_lock:
+            _admission_stats[kind]['shed'] += 1
+        return False
+    with _admission_lock:
+        _admission_stats[kind]['admitted'] += 1
+        _admission_stats[kind]['inFlight'] += 1
+    return True
+
+
+def _release_slot(kind):
+    _admission_slots[kind].release()
+    with _admission_lock:
+        _admission_stats[kind]['inFlight'] -= 1
+
+
+class Overloaded(Exception):
+    """No admission slot of `kind` became free before its deadline."""
+
+    def __init__(self, kind):
+        super().__init__(kind)
+        self.kind = kind
+
+
+@app.errorhandler(Overloaded)
+def overloaded(e):
+    return _shed(503, ADMISSION_DEADLINES[e.kind], 'Server busy, retry later')
+
+
+@app.errorhandler(sqlite3.OperationalError)
+def database_locked(e):
+    # A write from another process (or a busy_timeout expiring) is the same overload the
+    # slots shed, so the client gets the same retryable 503 instead of a 500
+    if 'database is locked' not in str(e):
+        raise e
+    with _admission_lock:
+        _admission_stats['dbLocked'] += 1
+    return _shed(503, ADMISSION_DEADLINES['write'], 'Server busy, retry later')
+
+
+@contextmanager
+def admission_slot(kind):
+    """Hold a `write` or `ingest` slot for the enclosed block; raises Overloaded (503) on timeout."""
+    if not _acquire_slot(kind):
+        raise Overloaded(kind)
+    try:
+        yield
+    finally:
+        _release_slot(kind)
+
+
+@app.before_request
+def admission_control():
+    if not request.path.startswith('/api/') or request.endpoint in (None, 'admission_stats'):
+        return None
+    wait = _take_client_token(request.remote_addr or 'unknown')
+    if wait:
+        with _admission_lock:
+            _admission_stats['rateLimited'] += 1
+        return _shed(429, wait, 'Too many requests')
+    if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+        return None
+    if not _acquire_slot('read'):
+        return _shed(503, ADMISSION_DEADLINES['read'], 'Server busy, retry later')
+    g.admission_slot = 'read'
+    return None
+
+
+@app.teardown_request
+def release_admission_slot(exc):
+    kind = g.pop('admission_slot', None)
+    if kind is not None:
+        _release_slot(kind)
+
+
+@app.route('/api/admission', methods=['GET'])
+def admission_stats():
+    with _admission_lock:
+        stats = {kind: dict(_admission_stats[kind]) for kind in ADMISSION_LIMITS}
+        rate_limited = _admission_stats['rateLimited']
+        db_locked = _admission_stats['dbLocked']
+        clients = len(_client_buckets)
+    for kind in ADMISSION_LIMITS:
+        stats[kind]['limit'] = ADMISSION_LIMITS[kind]
+        stats[kind]['deadlineSeconds'] = ADMISSION_DEADLINES[kind]
+    return jsonify({
+        'read': stats['read'],
+        'write': stats['write'],
+        'ingest': stats['ingest'],
+        'rateLimited': rate_limited,
+        'dbLocked': db_locked,
+        'clientRate': CLIENT_RATE,
+        'clientBurst': CLIENT_BURST,
+        'trackedClients': clients
+    })
+
+# ---------------- Static assets -----------------
+
+# Files under static/ are served from memory under a content-hashed name, gzipped once at startup
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+ASSET_MAX_AGE = 365 * 24 * 3600
+MIMETYPES = {'.css': 'text/css', '.js': 'application/javascript', '.html': 'text/html'}
+
+_assets = {}
+_asset_urls = {}
+_index_page = None
+
+
+def _cached_entry(body, mimetype):
+    return {
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        'mimetype': mimetype,
+        'etag': hashlib.sha256(body).hexdigest()[:16],
+    }
+
+
+def build_assets():
+    for root, _, files in os.walk(STATIC_DIR):
+        for filename in files:
+            path = os.path.join(root, filename)
+            rel = os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+            base, ext = os.path.splitext(rel)
+            with open(path, 'rb') as f:
+                body = f.read()
+            entry = _cached_entry(body, MIMETYPES.get(ext, 'application/octet-stream'))
+            name = f"{base}.{entry['etag'][:10]}{ext}"
+            _assets[name] = entry
+            _asset_urls[rel] = f"/assets/{name}"
+
+
+def asset_url(path):
+    return _asset_urls[path]
+
+
+def send_cached(entry, cache_control):
+    """Serve a prebuilt entry, gzipped when the client accepts it, with ETag revalidation."""
+    etag = f'"{entry["etag"]}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        resp = Response(status=304)
+    elif 'gzip' in request.accept_encodings:
+        resp = Response(entry['gzip'], mimetype=entry['mimetype'])
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = Response(entry['body'], mimetype=entry['mimetype'])
+    resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = cache_control
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
+
+
+build_assets()
+app.jinja_env.globals['asset_url'] = asset_url
+
+@app.route('/assets/<path:name>')
+def serve_asset(name):
+    entry = _assets.get(name)
+    if entry is None:
+        return jsonify({'error': 'Asset not found'}), 404
+    # The name changes whenever the content does, so clients may cache it forever
+    return send_cached(entry, f'public, max-age={ASSET_MAX_AGE}, immutable')
+
+
 @app.route('/')
 def home():
-    return render_template('index.html')
+    global _index_page
+    # The page is static apart from asset URLs, so render it once per process
+    if _index_page is None:
+        _index_page = _cached_entry(render_template('index.html').encode('utf-8'), 'text/html')
+    return send_cached(_index_page, 'no-cache')
+
+# ---------------- Streaming responses -----------------
+
+# Large lists are serialised batch by batch from the cursor instead of being built up for jsonify
+STREAM_BATCH_SIZE = 500
+
+
+def wants_ndjson():
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    return best == 'application/x-ndjson'
+
+
+def iter_batches(rows, size=STREAM_BATCH_SIZE):
+    """Yield lists of at most `size` rows; cursors are read with fetchmany, one batch at a time."""
+    if isinstance(rows, sqlite3.Cursor):
+        while True:
+            batch = rows.fetchmany(size)
+            if not batch:
+                return
+            yield batch
+    else:
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+
+def stream_rows(conn, rows, to_dict, key=None, head=None):
+    """Stream `rows` through a generator response and close `conn` once they are sent.
+
+    By default the body is a JSON array, or with `key` an object holding the
+    array under `key` after the fields of `head`. Clients sending
+    `Accept: application/x-ndjson` get one object per line instead, without
+    `head`. Each batch of rows is encoded and sent as one chunk. The request
+    context (and with it the admission slot) stays open until the last chunk.
+    """
+    dumps = lambda obj: app.json.dumps(obj, separators=(',', ':'))
+    ndjson = wants_ndjson()
+    if ndjson:
+        opening, closing = '', ''
+    elif key:
+        fields = ''.join(f"{dumps(k)}:{dumps(v)}," for k, v in (head or {}).items())
+        opening, closing = f"{{{fields}{dumps(key)}:[", ']}'
+    else:
+        opening, closing = '[', ']'
+
+    def generate():
+        try:
+            yield opening
+            first = True
+            for batch in iter_batches(rows):
+                items = [to_dict(r) for r in batch]
+                if ndjson:
+                    yield ''.join(dumps(item) + '\n' for item in items)
+                else:
+                    # One encoder call per batch; strip the list brackets and splice it in
+                    yield ('' if first else ',') + dumps(items)[1:-1]
+                first = False
+            yield closing
+        finally:
+            conn.close()
+
+    mimetype = 'application/x-ndjson' if ndjson else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
 
 @app.route('/api/login', methods=['POST'])
 def login():
@@ -445,36 +1179,44 @@ def login():
 
 # --- Interactive API endpoints ---
 
+def user_dict(r):
+    return {
+        'id': r['id'],
+        'name': r['name'] or r['email'],
+        'email': r['email'],
+        'role': r['role'],
+        'active': bool(r['active']),
+        'full_name': r['name'] or r['email'],
+        'address': r['address'],
+        'city': r['city'],
+        'mobile': r['mobile'],
+        'age': r['age'],
+        'experience': r['experience'],
+        'department': r['department'],
+        'join_date': r['join_date']
+    }
+
+
 @app.route('/api/users', methods=['GET'])
 def get_users():
     conn = get_db_connection()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT * FROM users").fetchall()
-    conn.close()
-    users = []
-    for r in rows:
-        users.append({
-            'id': r['id'],
-            'name': r['name'] or r['email'],
-            'email': r['email'],
-            'role': r['role'],
-            'active': bool(r['active']),
-            'full_name': r['name'] or r['email'],
-            'address': r['address'],
-            'city': r['city'],
-            'mobile': r['mobile'],
-            'age': r['age'],
-            'experience': r['experience'],
-            'department': r['department'],
-            'join_date': r['join_date']
-        })
+    # One read transaction, so the summary and the streamed rows see the same users
+    conn.execute("BEGIN")
+    counts = conn.execute(
+        """
+        SELECT COUNT(*), SUM(role = 'admin'), SUM(role = 'tester'), SUM(role = 'developer')
+        FROM users
+        """
+    ).fetchone()
     summary = {
-        'total': len(users),
-        'admins': sum(1 for u in users if u['role'] == 'admin'),
-        'testers': sum(1 for u in users if u['role'] == 'tester'),
-        'developers': sum(1 for u in users if u['role'] == 'developer')
+        'total': counts[0],
+        'admins': counts[1] or 0,
+        'testers': counts[2] or 0,
+        'developers': counts[3] or 0
     }
-    return jsonify({'summary': summary, 'users': users})
+    cur = conn.execute("SELECT * FROM users")
+    return stream_rows(conn, cur, user_dict, key='users', head={'summary': summary})
+
 
 
 @app.route('/api/users', methods=['POST'])
@@ -485,23 +1227,24 @@ def create_user():
         data.get('address'), data.get('city'), data.get('mobile'), data.get('age'),
         data.get('experience'), data.get('department'), data.get('join_date'), 1 if data.get('active', True) else 0
     )
-    conn = get_db_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            INSERT INTO users (email, password, role, name, address, city, mobile, age, experience, department, join_date, active)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            fields,
-        )
-        conn.commit()
-        new_id = cur.lastrowid
-        conn.close()
-        return jsonify({'id': new_id}), 201
-    except sqlite3.IntegrityError:
-        conn.close()
-        return jsonify({'error': 'Email already exists'}), 409
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                """
+                INSERT INTO users (email, password, role, name, address, city, mobile, age, experience, department, join_date, active)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+                """,
+                fields,
+            )
+            conn.commit()
+            new_id = cur.lastrowid
+            conn.close()
+            return jsonify({'id': new_id}), 201
+        except sqlite3.IntegrityError:
+            conn.close()
+            return jsonify({'error': 'Email already exists'}), 409
 
 
 @app.route('/api/users/<int:user_id>', methods=['PUT'])
@@ -517,21 +1260,23 @@ def update_user(user_id: int):
     if not sets:
         return jsonify({'error': 'No fields to update'}), 400
     values.append(user_id)
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(f"UPDATE users SET {', '.join(sets)} WHERE id = ?", values)
-    conn.commit()
-    conn.close()
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute(f"UPDATE users SET {', '.join(sets)} WHERE id = ?", values)
+        conn.commit()
+        conn.close()
     return jsonify({'success': True})
 
 
 @app.route('/api/users/<int:user_id>', methods=['DELETE'])
 def delete_user(user_id: int):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM users WHERE id = ?", (user_id,))
-    conn.commit()
-    conn.close()
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        conn.commit()
+        conn.close()
     return jsonify({'success': True})
 
 
@@ -576,14 +1321,15 @@ def system_health():
     status = 'Healthy' if cpu < 70 and memory < 75 and error_rate < 2.0 else 'Degraded'
     checked_at = datetime.utcnow().isoformat() + 'Z'
 
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO system_health (checked_at, cpu_percent, memory_percent, uptime_hours, error_rate, status) VALUES (?,?,?,?,?,?)",
-        (checked_at, cpu, memory, uptime_hours, error_rate, status),
-    )
-    conn.commit()
-    conn.close()
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT INTO system_health (checked_at, cpu_percent, memory_percent, uptime_hours, error_rate, status) VALUES (?,?,?,?,?,?)",
+            (checked_at, cpu, memory, uptime_hours, error_rate, status),
+        )
+        conn.commit()
+        conn.close()
 
     components = [
         {'name': 'API Gateway', 'status': random.choice(['OK', 'OK', 'OK', 'WARN'])},
@@ -604,10 +1350,8 @@ def system_health():
     })
 
 
-@app.route('/api/bug_reports', methods=['GET'])
-def bug_reports():
+def _simulate_bug_activity(conn):
     # Randomly add or close bugs to simulate dynamic changes
-    conn = get_db_connection()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM bugs")
     total = cur.fetchone()[0]
@@ -620,7 +1364,8 @@ def bug_reports():
             'Intermittent API timeout', 'Form validation fails', 'High CPU spike during peak',
             'Crash on logout', 'Session not persisting', 'UI glitch on resize'
         ]
-        created_at = datetime.utcnow() - timedelta(hours=random.randint(1, 72))
+        created_at = (datetime.utcnow() - timedelta(hours=random.randint(1, 72))).isoformat() + 'Z'
+        status = random.choice(statuses)
         cur.execute(
             """
             INSERT INTO bugs (title, severity, status, component, assignee, reporter, created_at)
@@ -629,40 +1374,152 @@ def bug_reports():
             (
                 random.choice(titles),
                 random.choice(severities),
-                random.choice(statuses),
+                status,
                 random.choice(components),
                 random.choice(['Dev A', 'Dev B', 'Dev C', 'QA Team']),
                 random.choice(['Tester X', 'Tester Y', 'User Z']),
-                created_at.isoformat() + 'Z',
+                created_at,
             ),
         )
+        bug_id = cur.lastrowid
+        record_bug_event(cur, bug_id, 'insert')
+        record_status_change(cur, bug_id, None, status, created_at)
     elif action == 'close':
-        cur.execute("UPDATE bugs SET status='closed' WHERE status!='closed' AND id IN (SELECT id FROM bugs ORDER BY RANDOM() LIMIT 1)")
+        row = cur.execute("SELECT id, status FROM bugs ORDER BY RANDOM() LIMIT 1").fetchone()
+        if row and row['status'] != 'closed':
+            cur.execute(
+                "UPDATE bugs SET status='closed', closed_at=? WHERE id = ?",
+                (datetime.utcnow().isoformat() + 'Z', row['id']),
+            )
+            record_bug_event(cur, row['id'], 'update')
+            record_status_change(cur, row['id'], row['status'], 'closed')
     conn.commit()
 
-    rows = cur.execute("SELECT * FROM bugs ORDER BY datetime(created_at) DESC LIMIT 100").fetchall()
-    conn.close()
 
-    reports = []
-    for r in rows:
-        reports.append({
-            'id': r['id'],
-            'title': r['title'],
-            'severity': r['severity'],
-            'status': r['status'],
-            'component': r['component'],
-            'assignee': r['assignee'],
-            'reporter': r['reporter'],
-            'createdAt': r['created_at']
-        })
+@app.route('/api/bug_reports', methods=['GET'])
+def bug_reports():
+    conn = get_db_connection()
+    try:
+        with admission_slot('write'):
+            _simulate_bug_activity(conn)
+
+        status = request.args.get('status')
+        since = request.args.get('since')
+        where = []
+        values = []
+        for field in ('severity', 'component'):
+            if request.args.get(field):
+                where.append(f"{field} = ?")
+                values.append(request.args[field])
+        tail = "ORDER BY datetime(created_at) DESC LIMIT 100"
+        # No archived bug is newer than the high-water mark: if the hot table alone fills
+        # the page with newer bugs, the archive cannot contribute and is never opened.
+        rows = select_bugs(conn, where=where, params=values, since=since, status=status, tail=tail, hot_only=True)
+        high_water = _archive_high_water(conn)
+        if high_water is not None and (len(rows) < 100 or rows[-1]['created_at'] <= high_water):
+            rows = select_bugs(conn, where=where, params=values, since=since, status=status, tail=tail)
+
+        # The page is capped at 100 rows, so the summary is taken from the fetched rows
+        severities = ['critical', 'high', 'medium', 'low']
+        summary = {
+            'total': len(rows),
+            'bySeverity': {s: sum(1 for r in rows if r['severity'] == s) for s in severities},
+            'open': sum(1 for r in rows if r['status'] in ['open', 'in progress'])
+        }
+    except BaseException:
+        # stream_rows() closes conn once the response is sent; until then it is ours
+        conn.close()
+        raise
+    return stream_rows(conn, rows, bug_report_dict, key='reports', head={'summary': summary})
+
+
+@app.route('/api/export/bugs', methods=['GET'])
+@reads_from_replica
+def export_bugs():
+    """Dump every bug, hot and archived, as a streamed JSON array or NDJSON."""
+    conn = get_db_connection()
+    # No ORDER BY: sorting the union would buffer it in a temp b-tree before the first row
+    cur = select_bugs(conn, lazy=True)
+    resp = stream_rows(conn, cur, lambda r: dict(bug_report_dict(r), closedAt=r['closed_at']))
+    ext = 'ndjson' if resp.mimetype == 'application/x-ndjson' else 'json'
+    resp.headers['Content-Disposition'] = f'attachment; filename="bugs.{ext}"'
+    return resp
+
+
+@app.route('/api/bug_reports/<int:bug_id>', methods=['DELETE'])
+def delete_bug(bug_id: int):
+    with admission_slot('write'):
+        conn = get_db_connection()
+        # ATTACH is not allowed inside a transaction, so it has to happen up front
+        if os.path.exists(ARCHIVE_DB_PATH):
+            attach_archive(conn)
+        cur = conn.cursor()
+        cur.execute("DELETE FROM bugs WHERE id = ?", (bug_id,))
+        if cur.rowcount == 0 and os.path.exists(ARCHIVE_DB_PATH):
+            # Closed bugs move to the archive after a while; they are deleted from there
+            cur.execute("DELETE FROM archive.bugs WHERE id = ?", (bug_id,))
+            if cur.rowcount:
+                bump_archive_version(conn)
+        if cur.rowcount == 0:
+            conn.close()
+            return jsonify({'error': 'Bug not found'}), 404
+        record_bug_event(cur, bug_id, 'delete')
+        conn.commit()
+        conn.close()
+    return jsonify({'success': True})
 
-    severities = ['critical', 'high', 'medium', 'low']
-    summary = {
-        'total': len(reports),
-        'bySeverity': {s: sum(1 for r in reports if r['severity'] == s) for s in severities},
-        'open': sum(1 for r in reports if r['status'] in ['open', 'in progress'])
-    }
-    return jsonify({'summary': summary, 'reports': reports})
+
+BUG_CHANGES_PAGE_SIZE = 1000
+
+
+@app.route('/api/bug_reports/changes', methods=['GET'])
+def bug_report_changes():
+    """Return bugs changed since cursor `since`, or a resync marker if the cursor is unusable."""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    latest = cur.execute("SELECT COALESCE(MAX(seq), 0) FROM bug_events").fetchone()[0]
+    floor = cur.execute("SELECT value FROM app_meta WHERE key = 'bug_events_compacted_through'").fetchone()
+    floor = int(floor[0]) if floor else 0
+    latest = max(latest, floor)
+    try:
+        since = int(request.args['since'])
+    except (KeyError, ValueError):
+        since = None
+    # Events at or below the floor were compacted away, and a cursor beyond the
+    # latest event belongs to another database: either way, deltas can't be trusted.
+    if since is None or since < floor or since > latest:
+        conn.close()
+        return jsonify({'resync': True, 'cursor': latest, 'changes': []})
+
+    events = cur.execute(
+        "SELECT seq, bug_id, op FROM bug_events WHERE seq > ? ORDER BY seq LIMIT ?",
+        (since, BUG_CHANGES_PAGE_SIZE),
+    ).fetchall()
+    # Collapse several events for one bug into its latest state
+    last_op = {}
+    for e in events:
+        last_op[e['bug_id']] = e['op']
+    live_ids = [bug_id for bug_id, op in last_op.items() if op != 'delete']
+    current = {}
+    if live_ids:
+        marks = ",".join("?" * len(live_ids))
+        for r in select_bugs(conn, where=[f"id IN ({marks})"], params=live_ids):
+            current[r['id']] = r
+    conn.close()
+
+    changes = []
+    for bug_id, op in last_op.items():
+        if bug_id in current:
+            changes.append({'op': 'upsert', 'report': bug_report_dict(current[bug_id])})
+        else:
+            changes.append({'op': 'delete', 'id': bug_id})
+    cursor = events[-1]['seq'] if events else since
+    return jsonify({
+        'resync': False,
+        'cursor': cursor,
+        'hasMore': cursor < latest,
+        'changes': changes
+    })
 
 
 @app.route('/api/ai_config', methods=['GET'])
@@ -675,14 +1532,15 @@ def ai_config():
     }
     checked_at = datetime.utcnow().isoformat() + 'Z'
 
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO ai_training (checked_at, total_samples, processed_today, accuracy_improvement) VALUES (?,?,?,?)",
-        (checked_at, training_data['total_samples'], training_data['processed_today'], training_data['accuracy_improvement'])
-    )
-    conn.commit()
-    conn.close()
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT INTO ai_training (checked_at, total_samples, processed_today, accuracy_improvement) VALUES (?,?,?,?)",
+            (checked_at, training_data['total_samples'], training_data['processed_today'], training_data['accuracy_improvement'])
+        )
+        conn.commit()
+        conn.close()
 
     models = [
         {'name': 'Severity Predictor', 'status': 'Active', 'accuracy': 87, 'last_trained': checked_at[:10]},
@@ -699,11 +1557,12 @@ def ai_config():
 
 
 @app.route('/api/analytics', methods=['GET'])
+@reads_from_replica
 def analytics():
     # Compute analytics from DB bugs
     conn = get_db_connection()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT severity, status, assignee, created_at FROM bugs").fetchall()
+    # Optional ?since= restricts to bugs created after a timestamp, which skips the archive when recent
+    rows = select_bugs(conn, "severity, status, assignee, created_at", since=request.args.get('since'))
     conn.close()
 
     # Status counts
@@ -778,6 +1637,179 @@ def analytics():
         'assignment_distribution': assignment_data
     })
 
+# ---------------- Lifecycle analytics -----------------
+
+RESOLVED_STATUSES = ('resolved', 'closed')
+# Lower edges (in days) of the backlog aging buckets
+AGE_BUCKET_EDGES = np.array([0, 1, 3, 7, 30])
+AGE_BUCKET_LABELS = ['<1d', '1-3d', '3-7d', '7-30d', '>30d']
+NO_RESOLUTION = np.iinfo(np.int64).max
+
+
+def _iso_sql(column):
+    # Exactly 19 characters (YYYY-MM-DDTHH:MM:SS) per row, so the packed column is fixed-width
+    return f"substr({column} || '0000-01-01T00:00:00', 1, 19)"
+
+
+def _iso_column(packed):
+    """Parse a group_concat()'d column of _iso_sql() timestamps into UTC epoch seconds.
+
+    Every value is 19 characters plus a comma, so the buffer reshapes into an
+    (n, 20) byte matrix and each field is a vectorised digit sum. This is far
+    cheaper than having SQLite parse each date.
+    """
+    if not packed:
+        return np.zeros(0, dtype=np.int64)
+    raw = np.frombuffer((packed + ',').encode('ascii'), dtype=np.uint8).reshape(-1, 20)
+
+    def field(start, end):
+        return (raw[:, start:end].astype(np.int64) - 48) @ (10 ** np.arange(end - start - 1, -1, -1))
+
+    year, month, day = field(0, 4), field(5, 7), field(8, 10)
+    # Days since 1970-01-01 from a proleptic Gregorian date (era-based civil-to-days algorithm)
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    days = era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+    return days * 86400 + field(11, 13) * 3600 + field(14, 16) * 60 + field(17, 19)
+
+
+def _label_codes_sql(labels, column):
+    """Return an SQL CASE expression mapping `column` to the index of its value in `labels`."""
+    if not labels:
+        return "0"
+    quote = lambda label: "'" + label.replace("'", "''") + "'"
+    whens = " ".join(f"WHEN {quote(label)} THEN {i}" for i, label in enumerate(labels))
+    return f"CASE {column} {whens} END"
+
+
+def _int_column(packed):
+    """Parse a group_concat()'d integer column."""
+    if not packed:
+        return np.zeros(0, dtype=np.int64)
+    return np.fromstring(packed, dtype=np.int64, sep=',')
+
+
+def _ttr_stats(hours):
+    if hours.size == 0:
+        return {'count': 0, 'meanHours': None, 'p50Hours': None, 'p90Hours': None, 'p95Hours': None}
+    p50, p90, p95 = np.percentile(hours, [50, 90, 95])
+    return {
+        'count': int(hours.size),
+        'meanHours': round(float(hours.mean()), 2),
+        'p50Hours': round(float(p50), 2),
+        'p90Hours': round(float(p90), 2),
+        'p95Hours': round(float(p95), 2),
+    }
+
+
+def _ttr_by_group(hours, codes, labels):
+    # Sort once by group, then every group is a contiguous slice
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+    sorted_hours = hours[order]
+    return {label: _ttr_stats(sorted_hours[bounds[i]:bounds[i + 1]]) for i, label in enumerate(labels)}
+
+
+def _counts_by_group(codes, bins, n_groups, n_bins, labels):
+    table = np.bincount(codes * n_bins + bins, minlength=n_groups * n_bins).reshape(n_groups, n_bins)
+    return {label: table[i].tolist() for i, label in enumerate(labels)}
+
+
+@app.route('/api/analytics/lifecycle', methods=['GET'])
+@reads_from_replica
+def lifecycle_analytics():
+    """Time-to-resolve, backlog aging and weekly throughput, computed with NumPy over status history."""
+    try:
+        weeks = max(1, min(int(request.args.get('weeks', 12)), 104))
+    except ValueError:
+        return jsonify({'error': 'weeks must be an integer'}), 400
+
+    conn = get_db_connection()
+    pairs = set(select_bugs(conn, "DISTINCT severity, component"))
+    sev_labels = sorted({sev for sev, _ in pairs})
+    comp_labels = sorted({comp for _, comp in pairs})
+    # Columns come back as one group_concat() string each rather than a million row tuples
+    packed = select_bugs(
+        conn,
+        f"id, {_label_codes_sql(sev_labels, 'severity')} AS sev, {_label_codes_sql(comp_labels, 'component')} AS comp, "
+        f"{_label_codes_sql(RESOLVED_STATUSES, 'status')} IS NOT NULL AS done, {_iso_sql('created_at')} AS created",
+        aggregate="group_concat(id), group_concat(sev), group_concat(comp), group_concat(done), group_concat(created)",
+    )
+    # Creation rows (from_status NULL) are not resolutions, even for bugs filed already closed
+    marks = ",".join("?" * len(RESOLVED_STATUSES))
+    transitions = conn.execute(
+        f"SELECT group_concat(bug_id), group_concat({_iso_sql('changed_at')}) "
+        f"FROM bug_status_history WHERE to_status IN ({marks}) AND from_status IS NOT NULL",
+        RESOLVED_STATUSES,
+    ).fetchone()
+    conn.close()
+
+    now = int(time.time())
+    ids, sev_codes, comp_codes, done = (np.concatenate([_int_column(p[i]) for p in packed]) for i in range(4))
+    created = np.concatenate([_iso_column(p[4]) for p in packed])
+    # Hot and archive rows arrive concatenated; sort by id for the searchsorted join below
+    order = np.argsort(ids, kind='stable')
+    ids, sev_codes, comp_codes, created = ids[order], sev_codes[order], comp_codes[order], created[order]
+    done = done[order].astype(bool)
+    n = ids.size
+
+    # First resolution per bug: map transitions onto bug positions, keep the earliest per position
+    resolved_at = np.full(n, NO_RESOLUTION, dtype=np.int64)
+    t_bug, t_at = _int_column(transitions[0]), _iso_column(transitions[1])
+    if t_bug.size and n:
+        pos = np.minimum(np.searchsorted(ids, t_bug), n - 1)
+        known = ids[pos] == t_bug
+        np.minimum.at(resolved_at, pos[known], t_at[known])
+
+    # Time to resolve, for bugs currently resolved/closed with a recorded resolution
+    has_ttr = done & (resolved_at != NO_RESOLUTION)
+    ttr_hours = np.maximum(resolved_at[has_ttr] - created[has_ttr], 0) / 3600.0
+
+    # Backlog aging of bugs still open
+    open_mask = ~done
+    age_days = (now - created[open_mask]) / 86400.0
+    age_bins = np.searchsorted(AGE_BUCKET_EDGES[1:], age_days, side='right')
+    n_buckets = len(AGE_BUCKET_LABELS)
+
+    # Weekly throughput, in UTC weeks starting Monday; the last bucket is the current week
+    today = datetime.utcnow().date()
+    first_week = today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+    week0 = int((datetime.combine(first_week, datetime.min.time()) - datetime(1970, 1, 1)).total_seconds())
+    opened_week = (created - week0) // (7 * 86400)
+    opened_in = (opened_week >= 0) & (opened_week < weeks)
+    closed_week = np.where(resolved_at != NO_RESOLUTION, (resolved_at - week0) // (7 * 86400), -1)
+    closed_in = (closed_week >= 0) & (closed_week < weeks)
+
+    def throughput(codes, labels):
+        opened = _counts_by_group(codes[opened_in], opened_week[opened_in], len(labels), weeks, labels)
+        closed = _counts_by_group(codes[closed_in], closed_week[closed_in], len(labels), weeks, labels)
+        return {label: {'opened': opened[label], 'closed': closed[label]} for label in labels}
+
+    return jsonify({
+        'bugCount': int(n),
+        'timeToResolve': {
+            'overall': _ttr_stats(ttr_hours),
+            'byComponent': _ttr_by_group(ttr_hours, comp_codes[has_ttr], comp_labels),
+            'bySeverity': _ttr_by_group(ttr_hours, sev_codes[has_ttr], sev_labels),
+        },
+        'aging': {
+            'buckets': AGE_BUCKET_LABELS,
+            'overall': np.bincount(age_bins, minlength=n_buckets).tolist(),
+            'byComponent': _counts_by_group(comp_codes[open_mask], age_bins, len(comp_labels), n_buckets, comp_labels),
+            'bySeverity': _counts_by_group(sev_codes[open_mask], age_bins, len(sev_labels), n_buckets, sev_labels),
+        },
+        'throughput': {
+            'weeks': [(first_week + timedelta(weeks=i)).isoformat() for i in range(weeks)],
+            'opened': np.bincount(opened_week[opened_in], minlength=weeks).tolist(),
+            'closed': np.bincount(closed_week[closed_in], minlength=weeks).tolist(),
+            'byComponent': throughput(comp_codes, comp_labels),
+            'bySeverity': throughput(sev_codes, sev_labels),
+        },
+    })
+
+
 # ---------------- Code Files API (restricted to seeded 10) -----------------
 
 def _is_valid_code_file_id(file_id: int) -> bool:
@@ -792,12 +1824,10 @@ def _is_valid_code_file_id(file_id: int) -> bool:
 @app.route('/api/code_files', methods=['GET'])
 def list_code_files():
     conn = get_db_connection()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT id, name, language, updated_at FROM code_files ORDER BY name").fetchall()
-    conn.close()
-    return jsonify([
-        {'id': r['id'], 'name': r['name'], 'language': r['language'], 'updatedAt': r['updated_at']} for r in rows
-    ])
+    cur = conn.execute("SELECT id, name, language, updated_at FROM code_files ORDER BY name")
+    return stream_rows(
+        conn, cur, lambda r: {'id': r['id'], 'name': r['name'], 'language': r['language'], 'updatedAt': r['updated_at']}
+    )
 
 
 @app.route('/api/code_files/<int:file_id>', methods=['GET'])
@@ -831,15 +1861,16 @@ def update_code_file(file_id: int):
     updates['updated_at'] = datetime.utcnow().isoformat() + 'Z'
     set_clause = ", ".join([f"{k} = ?" for k in updates.keys()])
     values = list(updates.values()) + [file_id]
-    conn = get_db_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute(f"UPDATE code_files SET {set_clause} WHERE id = ?", values)
-        conn.commit()
-    except sqlite3.IntegrityError:
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(f"UPDATE code_files SET {set_clause} WHERE id = ?", values)
+            conn.commit()
+        except sqlite3.IntegrityError:
+            conn.close()
+            return jsonify({'error': 'Duplicate name not allowed'}), 409
         conn.close()
-        return jsonify({'error': 'Duplicate name not allowed'}), 409
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -852,34 +1883,980 @@ def create_code_file():
     if not name or not language or not content:
         return jsonify({'error': 'name, language, and content are required'}), 400
     now = datetime.utcnow().isoformat() + 'Z'
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                "INSERT INTO code_files (name, language, content, created_at, updated_at) VALUES (?,?,?,?,?)",
+                (name, language, content, now, now),
+            )
+            conn.commit()
+            new_id = cur.lastrowid
+            conn.close()
+            return jsonify({'id': new_id}), 201
+        except sqlite3.IntegrityError:
+            conn.close()
+            return jsonify({'error': 'Duplicate name not allowed'}), 409
+
+
+@app.route('/api/code_files/<int:file_id>', methods=['DELETE'])
+def delete_code_file(file_id: int):
+    with admission_slot('write'):
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute("DELETE FROM code_files WHERE id = ?", (file_id,))
+        if cur.rowcount == 0:
+            conn.close()
+            return jsonify({'error': 'File not found'}), 404
+        conn.commit()
+        conn.close()
+    return jsonify({'success': True})
+
+
+# ---------------- Test Cases / Test Plans API -----------------
+
+MAX_PAGE_SIZE = 500
+JUNIT_BATCH_SIZE = 5000
+
+
+def _page_args(default_limit=100):
+    try:
+        limit = int(request.args.get('limit', default_limit))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        return None, None
+    return max(1, min(limit, MAX_PAGE_SIZE)), max(0, offset)
+
+
+@app.route('/api/test_cases', methods=['GET'])
+def list_test_cases():
+    limit, offset = _page_args()
+    if limit is None:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    where = []
+    values = []
+    for field in ('component', 'priority', 'status', 'owner'):
+        if request.args.get(field):
+            where.append(f"{field} = ?")
+            values.append(request.args[field])
+    q = request.args.get('q')
+    if q:
+        where.append("(key LIKE ? OR title LIKE ?)")
+        values.extend([f"%{q}%", f"%{q}%"])
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+
+    conn = get_db_connection()
+    cur = conn.cursor()
+    total = cur.execute(f"SELECT COUNT(*) FROM test_cases {where_sql}", values).fetchone()[0]
+    rows = cur.execute(
+        f"SELECT * FROM test_cases {where_sql} ORDER BY key LIMIT ? OFFSET ?",
+        values + [limit, offset],
+    ).fetchall()
+    conn.close()
+    # The UI consumes a plain array, so pagination metadata travels in headers
+    resp = jsonify([
+        {
+            'id': r['id'],
+            'key': r['key'],
+            'title': r['title'],
+            'component': r['component'],
+            'priority': r['priority'],
+            'status': r['status'],
+            'lastRun': r['last_run'],
+            'owner': r['owner']
+        } for r in rows
+    ])
+    resp.headers['X-Total-Count'] = str(total)
+    resp.headers['X-Limit'] = str(limit)
+    resp.headers['X-Offset'] = str(offset)
+    return resp
+
+
+@app.route('/api/test_cases/<path:key>/history', methods=['GET'])
+def test_case_history(key):
+    limit, offset = _page_args(default_limit=50)
+    if limit is None:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    conn = get_db_connection()
+    cur = conn.cursor()
+    rows = cur.execute(
+        """
+        SELECT r.run_id, r.status, r.duration, r.message, t.name, t.started_at
+        FROM test_results r JOIN test_runs t ON t.id = r.run_id
+        WHERE r.case_key = ?
+        ORDER BY r.run_id DESC LIMIT ? OFFSET ?
+        """,
+        (key, limit, offset),
+    ).fetchall()
+    conn.close()
+    return jsonify([
+        {
+            'runId': r['run_id'],
+            'runName': r['name'],
+            'startedAt': r['started_at'],
+            'status': r['status'],
+            'duration': r['duration'],
+            'message': r['message']
+        } for r in rows
+    ])
+
+
+@app.route('/api/test_plans', methods=['GET'])
+def list_test_plans():
+    limit, offset = _page_args()
+    if limit is None:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    where = []
+    values = []
+    for field in ('status', 'owner', 'version'):
+        if request.args.get(field):
+            where.append(f"{field} = ?")
+            values.append(request.args[field])
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+
+    conn = get_db_connection()
+    cur = conn.cursor()
+    total = cur.execute(f"SELECT COUNT(*) FROM test_plans {where_sql}", values).fetchone()[0]
+    rows = cur.execute(
+        f"SELECT * FROM test_plans {where_sql} ORDER BY name LIMIT ? OFFSET ?",
+        values + [limit, offset],
+    ).fetchall()
+    conn.close()
+    resp = jsonify([
+        {
+            'id': r['id'],
+            'name': r['name'],
+            'version': r['version'],
+            'owner': r['owner'],
+            'totalCases': r['total_cases'],
+            'lastUpdated': r['last_updated'],
+            'status': r['status']
+        } for r in rows
+    ])
+    resp.headers['X-Total-Count'] = str(total)
+    resp.headers['X-Limit'] = str(limit)
+    resp.headers['X-Offset'] = str(offset)
+    return resp
+
+
+def _junit_outcome(case):
+    """Map a JUnit <testcase> element to (status, message)."""
+    for child in case:
+        if child.tag in ('failure', 'error'):
+            return 'Failed', (child.get('message') or child.text or '').strip()[:500]
+        if child.tag == 'skipped':
+            return 'Skipped', (child.get('message') or '').strip()[:500]
+    return 'Passed', None
+
+
+def _junit_component(classname, suite):
+    """Component of a test case: the package holding its class, e.g. `auth` for com.acme.auth.LoginTest."""
+    parts = classname.split('.')
+    if len(parts) > 1:
+        return parts[-2]
+    return suite or 'junit'
+
+
+def _flush_junit_batch(conn, run_id, now, batch):
+    conn.executemany(
+        """
+        INSERT INTO test_cases (key, title, component, priority, status, last_run, owner)
+        VALUES (?, ?, ?, 'Medium', ?, ?, 'CI')
+        ON CONFLICT(key) DO UPDATE SET status = excluded.status, last_run = excluded.last_run
+        """,
+        [(key, title, component, status, now) for (key, title, component, status, _, _) in batch],
+    )
+    conn.executemany(
+        "INSERT INTO test_results (run_id, case_key, status, duration, message) VALUES (?,?,?,?,?)",
+        [(run_id, key, status, duration, message) for (key, _, _, status, duration, message) in batch],
+    )
+    conn.commit()
+
+
+def ingest_junit(stream, run_name=None, job=None):
+    """Stream-parse a JUnit XML report and record it as a new test run.
+
+    Elements are detached from the tree as soon as they are processed, so
+    memory stays flat regardless of report size. Results are written in
+    batches of JUNIT_BATCH_SIZE, one transaction per batch. With a `job`,
+    `stream` must be a real file; progress is reported by bytes consumed.
+    If parsing stops part way through, the batches already written are kept and
+    the run is recorded as Partial with their counts (or Error if nothing was
+    written). Malformed XML raises ValueError; any other exception propagates.
+    """
+    now = datetime.utcnow().isoformat() + 'Z'
     conn = get_db_connection()
+    try:
+        return _ingest_junit(conn, stream, run_name, job, now)
+    finally:
+        conn.close()
+
+
+def _ingest_junit(conn, stream, run_name, job, now):
+    # Bulk ingest: fewer fsyncs per batch commit, still safe against app crashes
+    conn.execute("PRAGMA synchronous = NORMAL")
     cur = conn.cursor()
+    cur.execute(
+        "INSERT INTO test_runs (name, started_at, status) VALUES (?,?,?)",
+        (run_name, now, 'Running'),
+    )
+    run_id = cur.lastrowid
+    conn.commit()
+    if job:
+        job.checkpoint({'runId': run_id})
+        size = max(1, os.fstat(stream.fileno()).st_size)
+
+    counts = {'Passed': 0, 'Failed': 0, 'Skipped': 0}
+    run_status = None
+    total_duration = 0.0
+    # Counts as of the last committed batch, for recording a run cut short by bad XML
+    committed = (dict(counts), total_duration)
+    batch = []
+    stack = []
     try:
-        cur.execute(
-            "INSERT INTO code_files (name, language, content, created_at, updated_at) VALUES (?,?,?,?,?)",
-            (name, language, content, now, now),
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'testsuite' and run_name is None:
+                    run_name = elem.get('name')
+                stack.append(elem)
+                continue
+            stack.pop()
+            if elem.tag != 'testcase':
+                continue
+            classname = elem.get('classname') or ''
+            name = elem.get('name') or ''
+            key = f"{classname}.{name}" if classname else name
+            suite = next((e.get('name') for e in reversed(stack) if e.tag == 'testsuite'), None)
+            component = _junit_component(classname, suite)
+            try:
+                duration = float(elem.get('time') or 0)
+            except ValueError:
+                duration = 0.0
+            status, message = _junit_outcome(elem)
+            counts[status] += 1
+            total_duration += duration
+            batch.append((key, name, component, status, duration, message))
+            # Detach the processed case so the tree never grows
+            if stack:
+                stack[-1].remove(elem)
+            elem.clear()
+            if len(batch) >= JUNIT_BATCH_SIZE:
+                _flush_junit_batch(conn, run_id, now, batch)
+                batch = []
+                committed = (dict(counts), total_duration)
+                if job:
+                    job.progress(min(99, 100 * stream.tell() // size), f"{sum(counts.values())} results ingested")
+                    if job.cancelled():
+                        run_status = 'Cancelled'
+                        break
+        if batch and run_status is None:
+            _flush_junit_batch(conn, run_id, now, batch)
+    except BaseException as e:
+        # Whatever stopped the parse (bad XML, a DB error, the worker shutting down),
+        # don't leave the run stuck as Running: keep what was committed.
+        conn.rollback()
+        done, done_duration = committed
+        total = sum(done.values())
+        try:
+            conn.execute(
+                """
+                UPDATE test_runs SET name = ?, finished_at = ?, total = ?, passed = ?, failed = ?,
+                    skipped = ?, duration = ?, status = ?
+                WHERE id = ?
+                """,
+                (run_name, datetime.utcnow().isoformat() + 'Z', total, done['Passed'], done['Failed'],
+                 done['Skipped'], round(done_duration, 3), 'Partial' if total else 'Error', run_id),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            app.logger.exception("Could not record interrupted JUnit run %s", run_id)
+        if not isinstance(e, ET.ParseError):
+            raise
+        if total:
+            raise ValueError(f"Invalid JUnit XML after {total} results (run {run_id} kept as Partial): {e}")
+        raise ValueError(f"Invalid JUnit XML: {e}")
+
+    summary = {
+        'id': run_id,
+        'name': run_name,
+        'startedAt': now,
+        'finishedAt': datetime.utcnow().isoformat() + 'Z',
+        'total': sum(counts.values()),
+        'passed': counts['Passed'],
+        'failed': counts['Failed'],
+        'skipped': counts['Skipped'],
+        'duration': round(total_duration, 3),
+        'status': run_status or ('Failed' if counts['Failed'] else 'Passed'),
+    }
+    conn.execute(
+        """
+        UPDATE test_runs SET name = ?, finished_at = ?, total = ?, passed = ?, failed = ?,
+            skipped = ?, duration = ?, status = ?
+        WHERE id = ?
+        """,
+        (run_name, summary['finishedAt'], summary['total'], summary['passed'], summary['failed'],
+         summary['skipped'], summary['duration'], summary['status'], run_id),
+    )
+    conn.commit()
+    return summary
+
+
+@app.route('/api/test_runs/junit', methods=['POST'])
+def upload_junit():
+    # Accept either a multipart upload (field "file") or a raw XML request body
+    # Uploads and parses take seconds, so they are bounded by their own pool rather than
+    # holding the write slot that every dashboard write queues on
+    with admission_slot('ingest'):
+        upload = request.files.get('file')
+        stream = upload.stream if upload else request.stream
+        if request.args.get('async') in ('1', 'true'):
+            # Spool to disk and let a background job parse it, so big reports never time out
+            os.makedirs(JOB_FILES_DIR, exist_ok=True)
+            fd, path = tempfile.mkstemp(suffix='.xml', dir=JOB_FILES_DIR)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    shutil.copyfileobj(stream, f)
+                with admission_slot('write'):
+                    job_id = submit_job('import_junit', {'path': path, 'name': request.args.get('name')})
+            except BaseException:
+                # No job was queued (client went away, write slot timed out, DB error): nothing else owns the file
+                _remove_job_file({'path': path})
+                raise
+            return jsonify({'jobId': job_id}), 202
+        try:
+            summary = ingest_junit(stream, request.args.get('name'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    return jsonify(summary), 201
+
+
+@app.route('/api/test_runs', methods=['GET'])
+def list_test_runs():
+    limit, offset = _page_args(default_limit=20)
+    if limit is None:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    conn = get_db_connection()
+    cur = conn.cursor()
+    rows = cur.execute(
+        "SELECT * FROM test_runs ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)
+    ).fetchall()
+    conn.close()
+    return jsonify([
+        {
+            'id': r['id'],
+            'name': r['name'],
+            'startedAt': r['started_at'],
+            'finishedAt': r['finished_at'],
+            'total': r['total'],
+            'passed': r['passed'],
+            'failed': r['failed'],
+            'skipped': r['skipped'],
+            'duration': r['duration'],
+            'status': r['status']
+        } for r in rows
+    ])
+
+
+# ---------------- Application Logs API -----------------
+
+# deploy.sh redirects stdout/stderr of the app into app.log next to app.py
+LOG_PATH = os.environ.get('APP_LOG_PATH', os.path.join(os.path.dirname(__file__), 'app.log'))
+LOG_BLOCK_SIZE = 64 * 1024
+# Upper bound on bytes examined per call, so a rare grep never scans a multi-GB file
+LOG_MAX_SCAN_BYTES = 8 * 1024 * 1024
+LOG_MAX_LINES = 1000
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'WARN', 'ERROR', 'CRITICAL')
+# The level is the first word of a line, after an optional timestamp:
+# "WARNING:root:..." from the stdlib default format,
+# "[2024-01-01 12:00:00,000] ERROR in app: ..." from Flask's handler.
+LOG_LEVEL_PREFIX = rb'^(?:\[[^\]\n]*\]\s*|[\d\-:,.T ]+\s)?'
+
+
+def _log_matcher(level, grep):
+    level_re = None
+    if level:
+        names = ('WARN', 'WARNING') if level.upper() in ('WARN', 'WARNING') else (level.upper(),)
+        level_re = re.compile(LOG_LEVEL_PREFIX + rb'(?:' + b'|'.join(n.encode() for n in names) + rb')\b')
+    needle = grep.lower().encode() if grep else None
+
+    def match(line):
+        if level_re and not level_re.match(line):
+            return False
+        if needle and needle not in line.lower():
+            return False
+        return True
+    return match
+
+
+def _tail_log(f, end, count, match):
+    """Collect up to `count` matching complete lines ending at `end`, reading backwards.
+
+    Returns (lines, cursor, has_more) where cursor is the offset just past the
+    last complete line, i.e. where a follow-up poll should resume.
+    """
+    pos = end
+    carry = b''
+    out = []
+    cursor = None
+    scanned = 0
+    while pos > 0 and len(out) < count and scanned < LOG_MAX_SCAN_BYTES:
+        size = min(LOG_BLOCK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        data = f.read(size) + carry
+        scanned += size
+        if cursor is None:
+            # Skip a partially written trailing line; the next poll picks it up
+            newline = data.rfind(b'\n')
+            if newline == -1:
+                carry = data
+                continue
+            cursor = pos + newline + 1
+            data = data[:newline]
+        parts = data.split(b'\n')
+        carry = parts.pop(0)
+        for line in reversed(parts):
+            if line and match(line):
+                out.append(line)
+                if len(out) >= count:
+                    break
+    if cursor is None:
+        # No complete line in the scanned range
+        return [], 0 if pos == 0 else end, pos > 0
+    if pos == 0 and carry and len(out) < count and match(carry):
+        out.append(carry)
+        carry = b''
+    out.reverse()
+    return out, cursor, pos > 0 or bool(carry)
+
+
+def _follow_log(f, offset, end, count, match):
+    """Read forward from `offset`, returning matching complete lines and the new cursor."""
+    f.seek(offset)
+    limit = min(end, offset + LOG_MAX_SCAN_BYTES)
+    cursor = offset
+    out = []
+    while cursor < limit and len(out) < count:
+        line = f.readline(limit - cursor)
+        if not line.endswith(b'\n'):
+            break
+        cursor += len(line)
+        line = line.rstrip(b'\n')
+        if line and match(line):
+            out.append(line)
+    return out, cursor, cursor < end
+
+
+@app.route('/api/logs', methods=['GET'])
+def get_logs():
+    level = request.args.get('level')
+    if level and level.upper() not in LOG_LEVELS:
+        return jsonify({'error': f"level must be one of {', '.join(LOG_LEVELS)}"}), 400
+    try:
+        count = max(1, min(int(request.args.get('lines', 100)), LOG_MAX_LINES))
+        offset = request.args.get('offset')
+        offset = int(offset) if offset not in (None, '') else None
+        inode = request.args.get('inode')
+        inode = int(inode) if inode not in (None, '') else None
+    except ValueError:
+        return jsonify({'error': 'lines, offset and inode must be integers'}), 400
+    if offset is not None and offset < 0:
+        return jsonify({'error': 'offset must be a non-negative integer'}), 400
+    match = _log_matcher(level, request.args.get('grep'))
+
+    try:
+        f = open(LOG_PATH, 'rb')
+    except FileNotFoundError:
+        return jsonify({'error': 'Log file not found'}), 404
+    with f:
+        st = os.fstat(f.fileno())
+        end = st.st_size
+        # A new inode or a shrunken file means the log was rotated or truncated:
+        # the old cursor is meaningless, so start over from the tail.
+        rotated = offset is not None and (offset > end or (inode is not None and inode != st.st_ino))
+        if offset is None or rotated:
+            lines, cursor, has_more = _tail_log(f, end, count, match)
+        else:
+            lines, cursor, has_more = _follow_log(f, offset, end, count, match)
+
+    return jsonify({
+        'lines': [l.decode('utf-8', errors='replace') for l in lines],
+        'cursor': cursor,
+        'inode': st.st_ino,
+        'size': end,
+        'rotated': rotated,
+        'hasMore': has_more
+    })
+
+
+# ---------------- Bug Archive and Change-Log Compaction -----------------
+
+_archive_lock = threading.Lock()
+
+
+def archive_closed_bugs(older_than_days=None, job=None):
+    """Move closed bugs closed more than `older_than_days` ago into the archive DB.
+
+    Rows are copied and deleted in batches, one transaction per batch. The copy
+    uses INSERT OR REPLACE keyed on the original id, so a batch interrupted
+    between the archive write and the hot-table delete is simply redone on the
+    next run. Each batch also raises the archive's created_at high-water mark,
+    which select_bugs() uses to decide whether a query can reach the archive.
+    When run as a background job, progress is reported and cancellation
+    honoured between batches.
+    """
+    days = BUG_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat() + 'Z'
+    moved = 0
+    conn = get_db_connection()
+    attach_archive(conn)
+    pending = conn.execute(
+        "SELECT COUNT(*) FROM main.bugs WHERE status = 'closed' AND COALESCE(closed_at, created_at) < ?",
+        (cutoff,),
+    ).fetchone()[0] if job else 0
+    while True:
+        # Held per batch, not per run, so a replica refresh waits for at most one batch
+        with _archive_lock:
+            # Take the write lock up front: the batch reads main.bugs before deleting from it,
+            # and upgrading a WAL read snapshot fails outright if another writer committed meanwhile
+            conn.execute("BEGIN IMMEDIATE")
+            ids = [r[0] for r in conn.execute(
+                "SELECT id FROM main.bugs WHERE status = 'closed' AND COALESCE(closed_at, created_at) < ? LIMIT ?",
+                (cutoff, MAINTENANCE_BATCH_SIZE),
+            )]
+            if not ids:
+                conn.rollback()
+                break
+            marks = ",".join("?" * len(ids))
+            conn.execute(
+                f"INSERT OR REPLACE INTO archive.bugs ({BUG_COLUMNS}) SELECT {BUG_COLUMNS} FROM main.bugs WHERE id IN ({marks})",
+                ids,
+            )
+            conn.execute(
+                f"""
+                INSERT INTO app_meta (key, value)
+                SELECT 'archive_created_through', MAX(created_at) FROM main.bugs WHERE id IN ({marks})
+                ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)
+                """,
+                ids,
+            )
+            conn.execute(f"DELETE FROM main.bugs WHERE id IN ({marks})", ids)
+            bump_archive_version(conn)
+            conn.commit()
+        moved += len(ids)
+        if job:
+            job.progress(100 * moved // max(pending, moved), f"Archived {moved} bugs")
+            if job.cancelled():
+                break
+    conn.close()
+    return moved
+
+
+def compact_bug_events(retention_hours=None, job=None):
+    """Drop change-feed events older than the retention window, in batches.
+
+    The highest compacted seq is stored in app_meta in the same transaction, so
+    /api/bug_reports/changes knows which cursors can no longer be served.
+    """
+    hours = BUG_EVENTS_RETENTION_HOURS if retention_hours is None else retention_hours
+    cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + 'Z'
+    removed = 0
+    conn = get_db_connection()
+    while True:
+        through = conn.execute(
+            "SELECT MAX(seq) FROM (SELECT seq FROM bug_events WHERE changed_at < ? ORDER BY seq LIMIT ?)",
+            (cutoff, MAINTENANCE_BATCH_SIZE),
+        ).fetchone()[0]
+        if through is None:
+            break
+        cur = conn.execute("DELETE FROM bug_events WHERE seq <= ?", (through,))
+        removed += cur.rowcount
+        conn.execute(
+            "INSERT OR REPLACE INTO app_meta (key, value) VALUES ('bug_events_compacted_through', ?)",
+            (str(through),),
         )
         conn.commit()
-        new_id = cur.lastrowid
+        if job and job.cancelled():
+            break
+    conn.close()
+    return removed
+
+
+def _maintenance_loop():
+    while True:
+        try:
+            submit_job('archive_bugs', unique=True)
+            submit_job('compact_bug_events', unique=True)
+        except sqlite3.Error as e:
+            app.logger.warning("Scheduling background maintenance failed: %s", e)
+        time.sleep(BUG_ARCHIVE_INTERVAL_SECONDS)
+
+
+def start_maintenance():
+    if BUG_ARCHIVE_INTERVAL_SECONDS > 0:
+        threading.Thread(target=_maintenance_loop, name='bug-maintenance', daemon=True).start()
+
+
+@app.route('/api/bugs/archive', methods=['POST'])
+def run_bug_archive():
+    data = request.get_json(silent=True) or {}
+    try:
+        days = int(data.get('older_than_days', BUG_ARCHIVE_AFTER_DAYS))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'older_than_days must be an integer'}), 400
+    if days < 0:
+        return jsonify({'error': 'older_than_days must not be negative'}), 400
+    with admission_slot('write'):
+        job_id = submit_job('archive_bugs', {'older_than_days': days})
+    return jsonify({'jobId': job_id, 'olderThanDays': days}), 202
+
+# ---------------- Background Jobs -----------------
+
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+JOB_POLL_SECONDS = 5
+# Attempts at recording a finished job before leaving it for recover_jobs() on restart
+JOB_FINISH_RETRIES = 5
+# A job that has been claimed this many times without finishing (each restart after its
+# worker process died counts) is marked failed instead of being requeued again
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+# Uploaded files waiting for an import job
+JOB_FILES_DIR = os.environ.get('JOB_FILES_DIR', os.path.join(os.path.dirname(__file__), 'job_files'))
+
+_job_wakeup = threading.Event()
+_job_claim_lock = threading.Lock()
+
+
+class JobContext:
+    """Handle given to a job handler for progress, cancellation and checkpoints."""
+
+    def __init__(self, job_id, checkpoint):
+        self.id = job_id
+        # Saved state from an interrupted earlier attempt, or None on a first run
+        self.resume = checkpoint
+
+    def _update(self, sql, values):
+        conn = get_db_connection()
+        conn.execute(f"UPDATE jobs SET {sql} WHERE id = ?", list(values) + [self.id])
+        conn.commit()
         conn.close()
-        return jsonify({'id': new_id}), 201
-    except sqlite3.IntegrityError:
+
+    def progress(self, percent, message=None):
+        self._update("progress = ?, message = COALESCE(?, message)", (max(0, min(100, int(percent))), message))
+
+    def checkpoint(self, state):
+        self._update("checkpoint = ?", (json.dumps(state),))
+
+    def cancelled(self):
+        conn = get_db_connection()
+        row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (self.id,)).fetchone()
         conn.close()
-        return jsonify({'error': 'Duplicate name not allowed'}), 409
+        return bool(row and row[0])
 
 
-@app.route('/api/code_files/<int:file_id>', methods=['DELETE'])
-def delete_code_file(file_id: int):
+def _job_archive_bugs(job, params):
+    return {'moved': archive_closed_bugs(params.get('older_than_days'), job=job)}
+
+
+def _job_compact_bug_events(job, params):
+    return {'removed': compact_bug_events(params.get('retention_hours'), job=job)}
+
+
+def _job_import_junit(job, params):
+    if job.resume and job.resume.get('runId'):
+        # The earlier attempt died mid-file; upserts are idempotent, so start over
+        conn = get_db_connection()
+        conn.execute(
+            "UPDATE test_runs SET status = 'Interrupted', finished_at = ? WHERE id = ? AND status = 'Running'",
+            (datetime.utcnow().isoformat() + 'Z', job.resume['runId']),
+        )
+        conn.commit()
+        conn.close()
+    try:
+        with open(params['path'], 'rb') as f:
+            return ingest_junit(f, params.get('name'), job=job)
+    finally:
+        # Only a crash skips this, and then the file is needed to redo the import
+        _remove_job_file(params)
+
+
+def _remove_job_file(params):
+    try:
+        os.remove(params['path'])
+    except (KeyError, FileNotFoundError):
+        pass
+
+
+def _job_optimize_db(job, params):
     conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM code_files WHERE id = ?", (file_id,))
-    if cur.rowcount == 0:
+    conn.execute("REINDEX")
+    job.progress(50, "Reindexed")
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
+    conn.commit()
+    conn.close()
+    return {'optimized': True}
+
+
+JOB_HANDLERS = {
+    'archive_bugs': _job_archive_bugs,
+    'compact_bug_events': _job_compact_bug_events,
+    'import_junit': _job_import_junit,
+    'optimize_db': _job_optimize_db,
+}
+
+
+def submit_job(job_type, params=None, priority=0, unique=False):
+    """Queue a job and wake a worker. With `unique`, reuse a queued or running job of the same type."""
+    conn = get_db_connection()
+    if unique:
+        row = conn.execute(
+            "SELECT id FROM jobs WHERE type = ? AND status IN ('queued','running') LIMIT 1", (job_type,)
+        ).fetchone()
+        if row:
+            conn.close()
+            return row[0]
+    cur = conn.execute(
+        "INSERT INTO jobs (type, params, priority, status, created_at) VALUES (?,?,?,?,?)",
+        (job_type, json.dumps(params or {}), priority, 'queued', datetime.utcnow().isoformat() + 'Z'),
+    )
+    conn.commit()
+    job_id = cur.lastrowid
+    conn.close()
+    _job_wakeup.set()
+    return job_id
+
+
+def _claim_next_job():
+    with _job_claim_lock:
+        conn = get_db_connection()
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        claimed = False
+        if row:
+            # Guarded on status so a second process sharing app.db cannot claim it too
+            cur = conn.execute(
+                """
+                UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1, worker_pid = ?
+                WHERE id = ? AND status = 'queued'
+                """,
+                (datetime.utcnow().isoformat() + 'Z', os.getpid(), row['id']),
+            )
+            conn.commit()
+            claimed = cur.rowcount == 1
         conn.close()
-        return jsonify({'error': 'File not found'}), 404
+    return row if claimed else None
+
+
+def _finish_job(job_id, status, result=None, error=None):
+    conn = get_db_connection()
+    conn.execute(
+        """
+        UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?,
+            progress = CASE WHEN ? = 'succeeded' THEN 100 ELSE progress END
+        WHERE id = ?
+        """,
+        (status, json.dumps(result) if result is not None else None, error,
+         datetime.utcnow().isoformat() + 'Z', status, job_id),
+    )
     conn.commit()
     conn.close()
-    return jsonify({'success': True})
 
 
+def _run_job(row):
+    job = JobContext(row['id'], json.loads(row['checkpoint']) if row['checkpoint'] else None)
+    handler = JOB_HANDLERS.get(row['type'])
+    result = error = None
+    if handler is None:
+        status, error = 'failed', f"Unknown job type: {row['type']}"
+    else:
+        try:
+            result = handler(job, json.loads(row['params']))
+            status = 'cancelled' if job.cancelled() else 'succeeded'
+        except Exception as e:
+            app.logger.exception("Job %s (%s) failed", row['id'], row['type'])
+            status, result, error = 'failed', None, str(e)
+    for attempt in range(JOB_FINISH_RETRIES):
+        try:
+            _finish_job(row['id'], status, result=result, error=error)
+            return
+        except sqlite3.Error as e:
+            app.logger.warning("Recording job %s as %s failed: %s", row['id'], status, e)
+            time.sleep(attempt + 1)
+    app.logger.error("Job %s left running; it will be requeued on restart", row['id'])
+
+
+def _job_worker():
+    while True:
+        try:
+            row = _claim_next_job()
+        except sqlite3.Error as e:
+            app.logger.warning("Claiming job failed: %s", e)
+            row = None
+        if row is None:
+            _job_wakeup.wait(JOB_POLL_SECONDS)
+            _job_wakeup.clear()
+            continue
+        try:
+            _run_job(row)
+        except Exception:
+            # Never let one job take its worker thread down with it
+            app.logger.exception("Worker crashed running job %s", row['id'])
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def recover_jobs():
+    """Requeue jobs whose worker process died mid-run; they resume from their checkpoint.
+
+    Called before this process starts its workers, so a job recorded under our own
+    pid belongs to an earlier process that had the same pid (common in containers).
+    A job that already used JOB_MAX_ATTEMPTS claims is marked failed instead, so one
+    that takes the process down with it is not retried on every restart.
+    """
+    conn = get_db_connection()
+    rows = conn.execute(
+        "SELECT id, type, params, worker_pid, cancel_requested, attempts FROM jobs WHERE status = 'running'"
+    ).fetchall()
+    now = datetime.utcnow().isoformat() + 'Z'
+    for r in rows:
+        if r['worker_pid'] and r['worker_pid'] != os.getpid() and _pid_alive(r['worker_pid']):
+            continue
+        if r['cancel_requested'] or r['attempts'] >= JOB_MAX_ATTEMPTS:
+            if r['cancel_requested']:
+                conn.execute("UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ?", (now, r['id']))
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                    (f"Worker died during each of {r['attempts']} attempts", now, r['id']),
+                )
+            if r['type'] == 'import_junit':
+                _remove_job_file(json.loads(r['params']))
+        else:
+            conn.execute("UPDATE jobs SET status = 'queued', worker_pid = NULL WHERE id = ?", (r['id'],))
+    conn.commit()
+    conn.close()
+
+
+def start_job_workers():
+    recover_jobs()
+    for i in range(JOB_WORKERS):
+        threading.Thread(target=_job_worker, name=f'job-worker-{i}', daemon=True).start()
+
+
+def job_dict(r):
+    return {
+        'id': r['id'],
+        'type': r['type'],
+        'params': json.loads(r['params']),
+        'priority': r['priority'],
+        'status': r['status'],
+        'progress': r['progress'],
+        'message': r['message'],
+        'result': json.loads(r['result']) if r['result'] else None,
+        'error': r['error'],
+        'cancelRequested': bool(r['cancel_requested']),
+        'attempts': r['attempts'],
+        'createdAt': r['created_at'],
+        'startedAt': r['started_at'],
+        'finishedAt': r['finished_at']
+    }
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    limit, offset = _page_args(default_limit=50)
+    if limit is None:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    where = []
+    values = []
+    for field in ('status', 'type'):
+        if request.args.get(field):
+            where.append(f"{field} = ?")
+            values.append(request.args[field])
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+    conn = get_db_connection()
+    rows = conn.execute(
+        f"SELECT * FROM jobs {where_sql} ORDER BY id DESC LIMIT ? OFFSET ?", values + [limit, offset]
+    ).fetchall()
+    conn.close()
+    return jsonify([job_dict(r) for r in rows])
+
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    data = request.get_json(silent=True) or {}
+    job_type = data.get('type')
+    if job_type not in JOB_HANDLERS or job_type == 'import_junit':
+        # import_junit needs an uploaded file: use POST /api/test_runs/junit?async=1
+        allowed = sorted(t for t in JOB_HANDLERS if t != 'import_junit')
+        return jsonify({'error': f"type must be one of {', '.join(allowed)}"}), 400
+    params = data.get('params') or {}
+    if not isinstance(params, dict):
+        return jsonify({'error': 'params must be an object'}), 400
+    try:
+        priority = int(data.get('priority', 0))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'priority must be an integer'}), 400
+    with admission_slot('write'):
+        job_id = submit_job(job_type, params, priority)
+    return jsonify({'id': job_id}), 202
+
+
+@app.route('/api/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id: int):
+    conn = get_db_connection()
+    row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    conn.close()
+    if not row:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job_dict(row))
+
+
+@app.route('/api/jobs/<int:job_id>/cancel', methods=['POST'])
+def cancel_job(job_id: int):
+    with admission_slot('write'):
+        now = datetime.utcnow().isoformat() + 'Z'
+        conn = get_db_connection()
+        cur = conn.cursor()
+        # Queued jobs are cancelled outright; running ones stop at their next checkpoint
+        cur.execute(
+            "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, finished_at = ? WHERE id = ? AND status = 'queued'",
+            (now, job_id),
+        )
+        if cur.rowcount == 0:
+            cur.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+        conn.commit()
+    row = cur.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    conn.close()
+    if not row:
+        return jsonify({'error': 'Job not found'}), 404
+    if row['type'] == 'import_junit' and row['status'] == 'cancelled':
+        # Never picked up by a worker, so nothing else will delete its spooled upload
+        _remove_job_file(json.loads(row['params']))
+    return jsonify(job_dict(row))
+
+
+def start_background_threads():
+    start_job_workers()
+    start_maintenance()
+    start_replica_refresher()
+
+
+# `python app.py` runs the debug reloader: its parent process only watches files and
+# restarts the child (WERKZEUG_RUN_MAIN=true) that serves requests, so only the child
+# runs workers. Imported by a WSGI server or tests, the threads start as usual.
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    start_background_threads()
+
 if __name__ == '__main__':
     app.run(debug=True)